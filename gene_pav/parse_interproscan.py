@@ -76,9 +76,9 @@ class InterProParser:
                     # NCBI format: ID=rna-*, use Name for transcript_id
                     if 'ID=rna' in attrs:
                         for attr in attrs.split(';'):
-                            if '=' not in attr:
+                            key, sep, value = attr.partition('=')
+                            if not sep:
                                 continue
-                            key, value = attr.split('=', 1)
 
                             if key == 'ID':
                                 mrna_id = value
@@ -95,10 +95,10 @@ class InterProParser:
                     # for VEuPathDB or Non-NCBI format: use ID
                     else:
                         for attr in attrs.split(';'):
-                            if '=' not in attr:
+                            key, sep, value = attr.partition('=')
+                            if not sep:
                                 continue
 
-                            key, value = attr.split('=', 1)
                             if key == 'Parent':
                                 parent_val = value
                             elif key == "ID":
@@ -127,9 +127,9 @@ class InterProParser:
                         protein_id = mrna_parent = None
 
                         for attr in attrs.split(';'):
-                            if '=' not in attr:
+                            key, sep, value = attr.partition('=')
+                            if not sep:
                                 continue
-                            key, value = attr.split('=', 1)
 
                             if key == 'Parent':
                                 mrna_parent = value
@@ -220,17 +220,17 @@ class InterProParser:
         if self.data is None or len(self.data) == 0:
             return {}
 
-        df = self.data.copy()
+        df = self.data
 
         # Filter to only IPR domains
-        ipr_df = df[df['interpro_accession'].str.startswith('IPR', na=False)].copy()
+        ipr_df = df[df['interpro_accession'].str.startswith('IPR', na=False)]
 
         if len(ipr_df) == 0:
             return {}
 
         # Determine grouping column
         if self.transcript_to_gene_map:
-            ipr_df['gene_id'] = ipr_df['protein_accession'].map(self.transcript_to_gene_map)
+            ipr_df = ipr_df.assign(gene_id=ipr_df['protein_accession'].map(self.transcript_to_gene_map))
             group_col = 'gene_id'
         else:
             group_col = 'protein_accession'
@@ -305,45 +305,44 @@ class InterProParser:
         if self.data is None or len(self.data) == 0:
             return pd.DataFrame()
 
-        df = self.data.copy()
+        df = self.data
 
-        # Calculate domain length
-        df['domain_length'] = df['stop_location'] - df['start_location'] + 1
-
-        # Get domain name (prefer description, fallback to accession)
-        df['domain_name'] = df['signature_description'].where(
-            df['signature_description'] != '',
-            df['signature_accession']
+        # Add domain length and name (prefer description, fallback to accession)
+        df = df.assign(
+            domain_length=df['stop_location'] - df['start_location'] + 1,
+            domain_name=df['signature_description'].where(
+                df['signature_description'] != '',
+                df['signature_accession']
+            )
         )
 
         # Sort by protein and domain length (descending)
         domain_stats = df.sort_values(
             ['protein_accession', 'domain_length'],
             ascending=[True, False]
-        ).copy()
+        )
 
         # Add rank within each protein
         domain_stats['rank'] = domain_stats.groupby('protein_accession').cumcount() + 1
 
         # Find longest IPR domain for each transcript
-        ipr_df = df[df['interpro_accession'].str.startswith('IPR', na=False)].copy()
+        ipr_df = df[df['interpro_accession'].str.startswith('IPR', na=False)]
 
         if len(ipr_df) > 0:
             # Get max IPR length for each transcript
             max_ipr_lengths = ipr_df.groupby('protein_accession')['domain_length'].max()
 
             # Count how many domains have the max length for each transcript
-            ipr_with_max = ipr_df.merge(
-                max_ipr_lengths.rename('max_ipr_length'),
-                left_on='protein_accession',
-                right_index=True
-            )
-            ipr_with_max['is_max'] = ipr_with_max['domain_length'] == ipr_with_max['max_ipr_length']
-            count_max = ipr_with_max.groupby('protein_accession')['is_max'].sum()
+            is_max = ipr_df['domain_length'] == ipr_df['protein_accession'].map(max_ipr_lengths)
+            count_max = is_max.groupby(ipr_df['protein_accession']).sum()
 
-            # Create mapping for is_longest_ipr_transcript
+            # Attach max length and max count per transcript
+            ipr_summary = pd.concat(
+                [max_ipr_lengths.rename('max_ipr_length'), count_max.rename('count_max_ipr')],
+                axis=1
+            )
             domain_stats = domain_stats.merge(
-                max_ipr_lengths.rename('max_ipr_length'),
+                ipr_summary,
                 left_on='protein_accession',
                 right_index=True,
                 how='left'
@@ -356,12 +355,6 @@ class InterProParser:
             )
 
             # Add multiple_longest_ipr_transcript column
-            domain_stats = domain_stats.merge(
-                count_max.rename('count_max_ipr'),
-                left_on='protein_accession',
-                right_index=True,
-                how='left'
-            )
             domain_stats['multiple_longest_ipr_transcript'] = (
                 domain_stats['is_longest_ipr_transcript'] &
                 (domain_stats['count_max_ipr'] > 1)
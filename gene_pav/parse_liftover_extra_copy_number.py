@@ -61,9 +61,9 @@ def parse_all_liftover_transcripts(gff_path):
 
             # Parse attributes to get ID
             for pair in attrs.split(';'):
-                if '=' not in pair:
+                k, sep, v = pair.partition('=')
+                if not sep:
                     continue
-                k, v = pair.split('=', 1)
 
                 if k == 'ID':
                     # Extract transcript ID
@@ -102,9 +102,9 @@ def parse_extra_copy_numbers(gff_path):
 
             # Parse attributes
             for pair in attrs.split(';'):
-                if '=' not in pair:
+                k, sep, v = pair.partition('=')
+                if not sep:
                     continue
-                k, v = pair.split('=', 1)
 
                 if k == 'ID':
                     # Extract transcript ID (e.g. from "ID=FOZG_02018-t36_1")
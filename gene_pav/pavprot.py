@@ -68,8 +68,8 @@ class PAVprot:
                 attrs = line.split('\t')[8]
                 attr_dict = {}
                 for pair in attrs.split(';'):
-                    if '=' in pair:
-                        k, v = pair.split('=', 1)
+                    k, sep, v = pair.partition('=')
+                    if sep:
                         attr_dict[k] = v
 
                 parent = attr_dict.get('Parent', '')
@@ -251,9 +251,9 @@ class PAVprot:
                 copy_number = None
 
                 for pair in attrs.split(';'):
-                    if '=' not in pair:
+                    k, sep, v = pair.partition('=')
+                    if not sep:
                         continue
-                    k, v = pair.split('=', 1)
 
                     if k == 'ID':
                         # Extract transcript ID (e.g. from "ID=FOZG_02018-t36_1")
@@ -310,14 +310,19 @@ class PAVprot:
 
         has_header = 'protein_accession' in first_line or 'gene_id' in first_line
 
+        # Only these columns are used once the IPR rows are selected
+        ipr_columns = ['protein_accession', 'analysis', 'signature_accession',
+                       'start_location', 'stop_location']
+
         if has_header:
-            # Read processed output file with header
-            df = pd.read_csv(interproscan_tsv, sep='\t')
+            # Read processed output file with header, parsing only the columns used below
+            wanted = set(ipr_columns) | {'interpro_accession'}
+            df = pd.read_csv(interproscan_tsv, sep='\t', usecols=lambda c: c in wanted)
 
             # Check if this is already a longest_ipr_domains file (has longestIPRdom or signature_description duplicated)
             if 'interpro_accession' in df.columns:
-                # Filter to only IPR domains
-                ipr_df = df[df['interpro_accession'].str.startswith('IPR', na=False)].copy()
+                # Filter to only IPR domains, keeping just the columns used below
+                ipr_df = df.loc[df['interpro_accession'].str.startswith('IPR', na=False), ipr_columns].copy()
 
                 if len(ipr_df) == 0:
                     return {}
@@ -333,8 +338,8 @@ class PAVprot:
             parser = InterProParser()
             df = parser.parse_tsv(interproscan_tsv)
 
-            # Filter to only IPR domains
-            ipr_df = df[df['interpro_accession'].str.startswith('IPR', na=False)].copy()
+            # Filter to only IPR domains, keeping just the columns used below
+            ipr_df = df.loc[df['interpro_accession'].str.startswith('IPR', na=False), ipr_columns].copy()
 
             if len(ipr_df) == 0:
                 return {}
@@ -344,13 +349,9 @@ class PAVprot:
 
         result = {}
 
-        for protein_acc in ipr_df['protein_accession'].unique():
-            protein_data = ipr_df[ipr_df['protein_accession'] == protein_acc]
-
+        # Process each protein's IPR domains
+        for protein_acc, protein_data in ipr_df.groupby('protein_accession', sort=False):
             # Get longest IPR domain info (for analysis and signature)
-            # Calculate individual domain lengths first
-            protein_data = protein_data.copy()
-            protein_data['domain_length'] = protein_data['stop_location'] - protein_data['start_location'] + 1
             longest_idx = protein_data['domain_length'].idxmax()
             longest_domain = protein_data.loc[longest_idx]
 
@@ -597,12 +597,12 @@ class GeneStructureAnalyzer:
         fwd_filtered = self.forward_df[
             (self.forward_df['pident'] >= min_identity) &
             (self.forward_df['qcoverage'] >= min_coverage)
-        ].copy()
+        ]
 
         rev_filtered = self.reverse_df[
             (self.reverse_df['pident'] >= min_identity) &
             (self.reverse_df['qcoverage'] >= min_coverage)
-        ].copy()
+        ]
 
         if fwd_filtered.empty or rev_filtered.empty:
             logger.warning("No hits pass quality filters for BBH analysis")
@@ -610,15 +610,17 @@ class GeneStructureAnalyzer:
 
         # Get best hits in forward direction (ref -> upd)
         best_fwd = fwd_filtered.loc[
-            fwd_filtered.groupby('qseqid')['evalue'].idxmin()
-        ][['qseqid', 'sseqid', 'pident', 'evalue', 'bitscore', 'qcoverage', 'scoverage']].copy()
+            fwd_filtered.groupby('qseqid')['evalue'].idxmin(),
+            ['qseqid', 'sseqid', 'pident', 'evalue', 'bitscore', 'qcoverage', 'scoverage']
+        ]
         best_fwd.columns = ['ref_gene', 'upd_gene', 'pident_fwd', 'evalue_fwd',
                            'bitscore_fwd', 'qcov_fwd', 'scov_fwd']
 
         # Get best hits in reverse direction (upd -> ref)
         best_rev = rev_filtered.loc[
-            rev_filtered.groupby('qseqid')['evalue'].idxmin()
-        ][['qseqid', 'sseqid', 'pident', 'evalue', 'bitscore', 'qcoverage', 'scoverage']].copy()
+            rev_filtered.groupby('qseqid')['evalue'].idxmin(),
+            ['qseqid', 'sseqid', 'pident', 'evalue', 'bitscore', 'qcoverage', 'scoverage']
+        ]
         best_rev.columns = ['upd_gene', 'ref_gene', 'pident_rev', 'evalue_rev',
                            'bitscore_rev', 'qcov_rev', 'scov_rev']
 
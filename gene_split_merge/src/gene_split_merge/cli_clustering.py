@@ -327,11 +327,13 @@ class ClusteringWorkflow:
 
         if df is not None:
             print(f"\nResults:")
+            # Cluster sizes (each cluster has a single representative)
+            cluster_sizes = df.groupby(['cluster_number', 'representative']).size()
+
             print(f"  Total sequences: {len(df)}")
-            print(f"  Total clusters: {df['cluster_number'].nunique()}")
+            print(f"  Total clusters: {len(cluster_sizes)}")
 
             # Cluster size distribution
-            cluster_sizes = df.groupby('cluster_number').size()
             print(f"\nCluster size distribution:")
             print(f"  Singletons: {(cluster_sizes == 1).sum()}")
             print(f"  2-5 members: {((cluster_sizes >= 2) & (cluster_sizes <= 5)).sum()}")
@@ -340,7 +342,7 @@ class ClusteringWorkflow:
 
             if (cluster_sizes > 1).any():
                 print(f"\nLargest clusters:")
-                largest = df.groupby(['cluster_number', 'representative']).size().sort_values(ascending=False).head(5)
+                largest = cluster_sizes.sort_values(ascending=False).head(5)
                 for (cluster_num, rep), size in largest.items():
                     print(f"  Cluster {cluster_num}: {size} members (rep: {rep})")
 
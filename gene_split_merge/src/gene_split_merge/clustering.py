@@ -464,9 +464,10 @@ class DiamondClusterer:
                 - size
                 - members (comma-separated)
         """
-        stats = df.groupby(['cluster_number', 'representative']).agg(
+        # Sort so each cluster's members are joined in order
+        stats = df.sort_values('sequence_id').groupby(['cluster_number', 'representative']).agg(
             size=('sequence_id', 'count'),
-            members=('sequence_id', lambda x: ','.join(sorted(x)))
+            members=('sequence_id', ','.join)
         ).reset_index()
 
         return stats.sort_values('size', ascending=False)
@@ -473,8 +473,9 @@ class DetectGeneSplitMerge:
 
                 # Print brief summary
                 if df is not None:
-                    print(f"  ✓ Clustered {len(df)} sequences into {df['cluster_number'].nunique()} clusters")
+                    # Cluster sizes
                     cluster_sizes = df.groupby('cluster_number').size()
+                    print(f"  ✓ Clustered {len(df)} sequences into {len(cluster_sizes)} clusters")
                     print(f"    Singletons: {(cluster_sizes == 1).sum()}")
                     print(f"    Multi-member clusters: {(cluster_sizes > 1).sum()}")
 
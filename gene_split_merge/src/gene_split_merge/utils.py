@@ -267,24 +267,28 @@ class DiamondAlignmentAnalyzer:
         Returns:
             Dictionary with alignment statistics
         """
+        coverage_cols = [col for col in ('qcoverage', 'scoverage') if col in df.columns]
+        means = df[['pident', 'length', 'evalue', 'bitscore'] + coverage_cols].mean()
+
+        # Count queries with hits
+        queries_with_hits = df.groupby('qseqid').size()
+
         stats = {
             'total_alignments': len(df),
-            'unique_queries': df['qseqid'].nunique(),
+            'unique_queries': len(queries_with_hits),
             'unique_subjects': df['sseqid'].nunique(),
-            'avg_identity': df['pident'].mean(),
+            'avg_identity': means['pident'],
             'median_identity': df['pident'].median(),
-            'avg_length': df['length'].mean(),
-            'avg_evalue': df['evalue'].mean(),
-            'avg_bitscore': df['bitscore'].mean()
+            'avg_length': means['length'],
+            'avg_evalue': means['evalue'],
+            'avg_bitscore': means['bitscore']
         }
 
         if 'qcoverage' in df.columns:
-            stats['avg_query_coverage'] = df['qcoverage'].mean()
+            stats['avg_query_coverage'] = means['qcoverage']
         if 'scoverage' in df.columns:
-            stats['avg_subject_coverage'] = df['scoverage'].mean()
+            stats['avg_subject_coverage'] = means['scoverage']
 
-        # Count queries with hits
-        queries_with_hits = df.groupby('qseqid').size()
         stats['queries_with_1_hit'] = (queries_with_hits == 1).sum()
         stats['queries_with_multiple_hits'] = (queries_with_hits > 1).sum()
         stats['avg_hits_per_query'] = queries_with_hits.mean()
@@ -307,7 +311,7 @@ class DiamondAlignmentAnalyzer:
             DataFrame with queries that have multiple hits (potential paralogs)
         """
         # Filter by identity
-        high_quality = df[df['pident'] >= min_identity].copy()
+        high_quality = df[df['pident'] >= min_identity]
 
         # Count hits per query
         hit_counts = high_quality.groupby('qseqid').size()
@@ -336,10 +340,7 @@ class DiamondAlignmentAnalyzer:
         filtered = df[df['pident'] >= min_identity]
 
         graph = {}
-        for _, row in filtered.iterrows():
-            query = row['qseqid']
-            subject = row['sseqid']
-
+        for query, subject in zip(filtered['qseqid'], filtered['sseqid']):
             if query not in graph:
                 graph[query] = []
             graph[query].append(subject)